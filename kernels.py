@@ -0,0 +1,101 @@
+"""
+Per-voxel kernels for the viewers' loading and display pipelines.
+"""
+import threading
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Fall back to NumPy when numba is not installed
+    njit = None
+
+# Numba's default workqueue threading layer cannot run parallel kernels from two threads at once
+_parallel_lock = threading.Lock()
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _quantize_flat(src, dst, mn, inv):
+        # No fastmath: it would let the comparisons below assume NaN never occurs
+        for i in prange(src.size):
+            v = (src[i] - mn) * inv
+            if v != v:  # NaN, e.g. masked voxels outside the brain
+                dst[i] = 0
+            elif v < 0:
+                dst[i] = 0
+            elif v > 255:
+                dst[i] = 255
+            else:
+                dst[i] = np.uint8(v)
+
+    def quantize_u8(src, dst, mn, inv):
+        """
+        Window a volume into a preallocated uint8 array of the same shape in one parallel pass.
+        NaN voxels map to 0.
+        """
+        with _parallel_lock:
+            _quantize_flat(src.reshape(-1), dst.reshape(-1), mn, inv)
+
+    @njit(parallel=True, cache=True)
+    def _minmax_flat(flat):
+        mn = np.inf
+        mx = -np.inf
+        for i in prange(flat.size):
+            v = flat[i]
+            if v == v:  # Skip NaN
+                mn = min(mn, v)
+                mx = max(mx, v)
+        return mn, mx
+
+    def minmax(arr):
+        """
+        Return the minimum and maximum of an array in a single parallel pass, ignoring NaNs.
+        Empty or all-NaN arrays give (0.0, 0.0).
+        """
+        if arr.size == 0:
+            return 0.0, 0.0
+        with _parallel_lock:
+            mn, mx = _minmax_flat(arr.reshape(-1))
+        if mn > mx:
+            return 0.0, 0.0
+        return float(mn), float(mx)
+
+    @njit(nogil=True, cache=True)
+    def render_plane(vol_u8, slice_idx, lut, out_u8):
+        """
+        Rotate a slice of an axis-major uint8 volume by 180 degrees and map it through a LUT.
+        """
+        src = vol_u8[slice_idx]
+        rows, cols = src.shape
+        for i in range(rows):
+            for j in range(cols):
+                out_u8[rows - 1 - i, cols - 1 - j] = lut[src[i, j]]
+else:
+    def render_plane(vol_u8, slice_idx, lut, out_u8):
+        """
+        Rotate a slice of an axis-major uint8 volume by 180 degrees and map it through a LUT.
+        """
+        np.take(lut, vol_u8[slice_idx][::-1, ::-1], out=out_u8)
+
+    def quantize_u8(src, dst, mn, inv):
+        """
+        Window a volume into a preallocated uint8 array of the same shape, one slice at a time.
+        NaN voxels map to 0.
+        """
+        for i in range(src.shape[0]):
+            tmp = (src[i].astype(np.float32) - mn) * inv
+            np.clip(tmp, 0, 255, out=tmp)
+            np.nan_to_num(tmp, copy=False, nan=0.0)
+            dst[i] = tmp
+
+    def minmax(arr):
+        """
+        Return the minimum and maximum of an array, ignoring NaNs.
+        Empty or all-NaN arrays give (0.0, 0.0).
+        """
+        if arr.dtype.kind == 'f':
+            arr = arr[~np.isnan(arr)]
+        if arr.size == 0:
+            return 0.0, 0.0
+        return float(arr.min()), float(arr.max())
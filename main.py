@@ -1,21 +1,28 @@
 import sys
+import threading
+from functools import partial
 import numpy as np
-import itk
+import nibabel as nib
 import vtk
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QLabel, QSlider, QFrame, QVBoxLayout, QHBoxLayout, QWidget,
-    QFileDialog, QPushButton, QToolBar, QStatusBar, QMessageBox, QTabWidget, QGroupBox
+    QFileDialog, QPushButton, QToolBar, QStatusBar, QMessageBox, QTabWidget, QGroupBox, QGraphicsScene,
+    QGraphicsView
 )
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QSize, QPoint
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor, QIcon
+from PyQt5.QtCore import (
+    Qt, QTimer, QThread, pyqtSignal, QSize, QPoint, QRectF, QObject, QRunnable, QThreadPool
+)
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor, QIcon, QPen
 from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 
+from kernels import minmax, quantize_u8, render_plane
+
 
 class ImageLoaderThread(QThread):
     """
     Thread for loading NIfTI images to prevent GUI freezing.
     """
-    image_loaded = pyqtSignal(np.ndarray, object)  # Emits the image array and ITK image object
+    image_loaded = pyqtSignal(np.ndarray, object, tuple)  # Emits the image array, NIfTI image object and (min, max)
     error_occurred = pyqtSignal(str)
 
     def __init__(self, file_path):
@@ -24,13 +31,52 @@ class ImageLoaderThread(QThread):
 
     def run(self):
         try:
-            image = itk.imread(self.file_path)
-            image_array = itk.GetArrayFromImage(image)
-            self.image_loaded.emit(image_array, image)
+            # Memory-map uncompressed files so voxels are only read from disk when accessed
+            image = nib.load(self.file_path, mmap=True)
+            # NIfTI stores (x, y, z); the transposed view gives the (z, y, x) order the viewers expect
+            image_array = np.asanyarray(image.dataobj).T
+            if not image_array.dtype.isnative:
+                # Big-endian files are mapped as stored; the kernels only accept native byte order
+                image_array = image_array.astype(image_array.dtype.newbyteorder('='))
+            # Intensity bounds are computed once here and shared by both viewers
+            self.image_loaded.emit(image_array, image, minmax(image_array))
         except Exception as e:
             self.error_occurred.emit(str(e))
 
 
+class VolumePrepareSignals(QObject):
+    """
+    Signals used by VolumePrepareTask to hand its result back to the GUI thread.
+    """
+    prepared = pyqtSignal(int, object, tuple, tuple)  # Emits the load generation, uint8 volume, spacing and (min, max)
+    failed = pyqtSignal(int, str)  # Emits the load generation and the error message
+
+
+class VolumePrepareTask(QRunnable):
+    """
+    Thread pool task running the NumPy/Numba part of a 3D renderer load.
+    """
+
+    def __init__(self, prepare, signals, generation, image_array, bounds):
+        super().__init__()
+        self.prepare = prepare
+        self.signals = signals
+        self.generation = generation
+        self.image_array = image_array
+        self.bounds = bounds
+
+    def run(self):
+        try:
+            result = self.prepare(self.generation, self.image_array, self.bounds)
+        except Exception as e:
+            # An exception escaping a QRunnable aborts the application
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        if result is not None:
+            volume, spacing = result
+            self.signals.prepared.emit(self.generation, volume, spacing, self.bounds)
+
+
 class ImageViewer(QWidget):
     """
     2D Orthogonal Image Viewer with Crosshairs .
@@ -40,13 +86,13 @@ class ImageViewer(QWidget):
         super().__init__(parent)
         self.brightness = {"xy": 0, "xz": 0, "zy": 0}  # Brightness adjustments
         self.contrast = {"xy": 1, "xz": 1, "zy": 1}  # Contrast multipliers
+        self._lut = {view: np.arange(256, dtype=np.uint8) for view in ("xy", "xz", "zy")}  # Display LUTs
+        # Scene items of each view: the slice pixmap and the crosshair drawn over it
+        self._pix_item = {}
+        self._crosshair_items = {}
         self.initUI()
         self.image_array = None
         self.current_crosshair = None
-        self.timer = QTimer()
-        self.timer.setInterval(30)
-        self.timer.timeout.connect(self.update_crosshair)
-        self.timer.start()
         self.label = QLabel()
         self.zoom_level_xy = 0.4
         self.zoom_level_xz = 0.4
@@ -57,10 +103,21 @@ class ImageViewer(QWidget):
         self.playing_state = {"xy": False, "xz": False, "yz": False}
         # Create timers for each view
         self.timers = {"xy": QTimer(self), "xz": QTimer(self), "yz": QTimer(self)}
-        self.timers["yz"].timeout.connect(lambda: self.update_slice("yz"))
+        self.timers["yz"].timeout.connect(partial(self.update_slice, "yz"))
         # Connect timers to slice updating function
-        self.timers["xy"].timeout.connect(lambda: self.update_slice("xy"))
-        self.timers["xz"].timeout.connect(lambda: self.update_slice("xz"))
+        self.timers["xy"].timeout.connect(partial(self.update_slice, "xy"))
+        self.timers["xz"].timeout.connect(partial(self.update_slice, "xz"))
+        # Coalesce mouse-move redraws to at most one per frame
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)
+        self._redraw_timer.timeout.connect(self.refresh_overlay_only)
+        # Scaled slice pixmaps without the crosshair, redrawn only when their inputs change
+        self._base_pix = {}
+        self._base_key = {}
+        # Half-resolution, fast-scaled rendering while dragging a slice slider or playing
+        self._interacting = False
+        self._slider_dragging = False
 
     def create_play_icon(self):
         # Create a green play icon
@@ -100,14 +157,7 @@ class ImageViewer(QWidget):
     def update_slice(self, view):
 
         slider = self.get_slider(view)
-        xy_idx = self.xy_slider.value()
-        xz_idx = self.xz_slider.value()
-        zy_idx = self.zy_slider.value()
-
-        self.update_xy_image(xy_idx)
-        self.update_xz_image(xz_idx)
-        self.update_zy_image(zy_idx)
-        # Increment the slider value by 1
+        # Increment the slider value by 1; its valueChanged signal redraws only this view
         current_value = slider.value()
         if current_value < slider.maximum() - 1:
             slider.setValue(current_value + 1)  # Increment slider by 1
@@ -126,64 +176,54 @@ class ImageViewer(QWidget):
             return self.zy_slider
 
     def initUI(self):
-        # Labels for displaying images with fixed size
-        self.xy_label = QLabel(self)
-        self.xy_label.setAlignment(Qt.AlignCenter)
-        self.xy_label.setMinimumSize(200, 200)
-        self.xy_label.setMaximumHeight(300)
-        self.xy_label.setStyleSheet("border: 1px solid rgb(9, 132, 227);; background-color: black;")
-        # Set minimum size for XY view
-        self.xy_label.mousePressEvent = self.mouse_press_event_xy
-        self.xy_label.setMouseTracking(True)
-        self.xy_label.mouseMoveEvent = self.mouse_move_event_xy
-
-        self.xz_label = QLabel(self)
-        self.xz_label.setAlignment(Qt.AlignCenter)
-        self.xz_label.setMinimumSize(200, 200)  # Set minimum size for XZ view
-        self.xz_label.setMaximumHeight(300)
-        self.xz_label.setStyleSheet("border: 1px solid rgb(9, 132, 227);; background-color: black;")
-        self.xz_label.mousePressEvent = self.mouse_press_event_xz
-        self.xz_label.setMouseTracking(True)
-        self.xz_label.mouseMoveEvent = self.mouse_move_event_xz
-
-        self.zy_label = QLabel(self)
-        self.zy_label.setAlignment(Qt.AlignCenter)
-        self.zy_label.setMinimumSize(200, 200)  # Set minimum size for YZ view
-        self.zy_label.setMaximumHeight(300)
-        self.zy_label.setStyleSheet("border: 1px solid rgb(9, 132, 227);; background-color: black;")
-        self.zy_label.mousePressEvent = self.mouse_press_event_zy
-        self.zy_label.setMouseTracking(True)
-        self.zy_label.mouseMoveEvent = self.mouse_move_event_zy
+        # Graphics views for displaying images with fixed size
+        self.xy_view = self.create_slice_view('xy')
+        self.xy_view.mousePressEvent = self.mouse_press_event_xy
+        self.xy_view.mouseMoveEvent = self.mouse_move_event_xy
+
+        self.xz_view = self.create_slice_view('xz')
+        self.xz_view.mousePressEvent = self.mouse_press_event_xz
+        self.xz_view.mouseMoveEvent = self.mouse_move_event_xz
+
+        self.zy_view = self.create_slice_view('zy')
+        self.zy_view.mousePressEvent = self.mouse_press_event_zy
+        self.zy_view.mouseMoveEvent = self.mouse_move_event_zy
 
         # Sliders for navigating slices
         self.xy_slider = QSlider(Qt.Horizontal, self)
         self.xz_slider = QSlider(Qt.Horizontal, self)
         self.zy_slider = QSlider(Qt.Horizontal, self)
+        self.xy_slider.valueChanged.connect(self.update_xy_image)
+        self.xz_slider.valueChanged.connect(self.update_xz_image)
+        self.zy_slider.valueChanged.connect(self.update_zy_image)
+        for slider in (self.xy_slider, self.xz_slider, self.zy_slider):
+            slider.sliderPressed.connect(partial(self.set_slider_dragging, True))
+            slider.sliderReleased.connect(partial(self.set_slider_dragging, False))
 
         # Brightness, Contrast, and Zoom sliders
         self.xy_brightness_slider = QSlider(Qt.Horizontal, self)
         self.xy_brightness_slider.setRange(10, 300)
-        self.xy_brightness_slider.valueChanged.connect(lambda value, v="xy": self.update_brightness(value, v))
+        self.xy_brightness_slider.valueChanged.connect(partial(self.update_brightness, view="xy"))
         # self.xy_brightness_slider["xy"] = self.xy_brightness_slider
         self.xz_brightness_slider = QSlider(Qt.Horizontal, self)
 
         self.xz_brightness_slider.setRange(10, 300)
-        self.xz_brightness_slider.valueChanged.connect(lambda value, v="xz": self.update_brightness(value, v))
+        self.xz_brightness_slider.valueChanged.connect(partial(self.update_brightness, view="xz"))
         self.zy_brightness_slider = QSlider(Qt.Horizontal, self)
         self.zy_brightness_slider.setRange(10, 300)
-        self.zy_brightness_slider.valueChanged.connect(lambda value, v="zy": self.update_brightness(value, v))
+        self.zy_brightness_slider.valueChanged.connect(partial(self.update_brightness, view="zy"))
 
         self.xy_contrast_slider = QSlider(Qt.Horizontal, self)
         self.xy_contrast_slider.setRange(0, 100)  # Scale from 1x to 3x
-        self.xy_contrast_slider.valueChanged.connect(lambda value, v="xy": self.update_contrast(value, v))
+        self.xy_contrast_slider.valueChanged.connect(partial(self.update_contrast, view="xy"))
 
         self.xz_contrast_slider = QSlider(Qt.Horizontal, self)
         self.xz_contrast_slider.setRange(0, 100)  # Scale from 1x to 3x
-        self.xz_contrast_slider.valueChanged.connect(lambda value, v="xz": self.update_contrast(value, v))
+        self.xz_contrast_slider.valueChanged.connect(partial(self.update_contrast, view="xz"))
 
         self.zy_contrast_slider = QSlider(Qt.Horizontal, self)
         self.zy_contrast_slider.setRange(0, 100)  # Scale from 1x to 3x
-        self.zy_contrast_slider.valueChanged.connect(lambda value, v="zy": self.update_contrast(value, v))
+        self.zy_contrast_slider.valueChanged.connect(partial(self.update_contrast, view="zy"))
 
         self.xy_zoom_slider = QSlider(Qt.Horizontal, self)
         self.xz_zoom_slider = QSlider(Qt.Horizontal, self)
@@ -277,11 +317,11 @@ class ImageViewer(QWidget):
         # Create a layout for the views
         views_layout = QVBoxLayout()
         views_layout.addWidget(QLabel("Axial (XY) View"))
-        views_layout.addWidget(self.xy_label)
+        views_layout.addWidget(self.xy_view)
         views_layout.addWidget(QLabel("Coronal (XZ) View"))
-        views_layout.addWidget(self.xz_label)
+        views_layout.addWidget(self.xz_view)
         views_layout.addWidget(QLabel("Sagittal (YZ) View"))
-        views_layout.addWidget(self.zy_label)
+        views_layout.addWidget(self.zy_view)
 
         # Add the views layout to the main layout
         main_layout.addLayout(views_layout)
@@ -289,21 +329,59 @@ class ImageViewer(QWidget):
         # Set the main layout as the window's layout
         self.setLayout(main_layout)
 
+    def create_slice_view(self, plane):
+        """
+        Create the graphics view of a plane, holding the slice pixmap and the crosshair items.
+        """
+        scene = QGraphicsScene(self)
+        view_widget = QGraphicsView(scene, self)
+        view_widget.setAlignment(Qt.AlignCenter)
+        view_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        view_widget.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # The hidden scroll bars still react to the wheel and arrow keys; ignore both so the
+        # slice stays centred, as the click and crosshair mappings assume
+        view_widget.wheelEvent = lambda event: event.ignore()
+        view_widget.keyPressEvent = lambda event: event.ignore()
+        view_widget.setMinimumSize(200, 200)
+        view_widget.setMaximumHeight(300)
+        view_widget.setStyleSheet("border: 1px solid rgb(9, 132, 227);; background-color: black;")
+        view_widget.setMouseTracking(True)
+        view_widget.viewport().setMouseTracking(True)
+
+        self._pix_item[plane] = scene.addPixmap(QPixmap())
+        vertical_line = scene.addLine(0, 0, 0, 0, QPen(QColor(255, 0, 0)))  # Red color for crosshair
+        horizontal_line = scene.addLine(0, 0, 0, 0, QPen(QColor(255, 0, 0)))
+        circle = scene.addEllipse(0, 0, 10, 10, QPen(QColor(0, 255, 0)))  # Small circle on the crosshair
+        self._crosshair_items[plane] = (vertical_line, horizontal_line, circle)
+        for item in self._crosshair_items[plane]:
+            item.setVisible(False)
+        return view_widget
+
     def update_brightness(self, value, view):
         self.contrast[view] = value / 100.0  # Scale to usable range
+        self.update_lut(view)
         self.update_all_images()  # Refresh images
 
     def update_contrast(self, value, view):
         self.brightness[view] = value
+        self.update_lut(view)
         self.update_all_images()  # Refresh images
 
+    def update_lut(self, view):
+        """
+        Rebuild the 256-entry brightness/contrast lookup table of a view.
+        """
+        levels = np.arange(256) * self.contrast[view] + self.brightness[view]
+        self._lut[view] = np.clip(levels, 0, 255).astype(np.uint8)
+        self._base_key.pop(view, None)
+
     def toggle_play(self, view):
         # Toggle play/pause for the specified view
         if view == "xy":
             self.playing_state["xy"] = not self.playing_state["xy"]
 
             if self.playing_state["xy"]:
-                self.timers["xy"].start(2)
+                self.timers["xy"].start(16)
                 self.playing_state["xy"] = True
                 self.xy_play_button.setIcon(self.create_pause_icon())
             else:
@@ -316,7 +394,7 @@ class ImageViewer(QWidget):
             self.playing_state["xz"] = not self.playing_state["xz"]
 
             if self.playing_state["xz"]:
-                self.timers["xz"].start(2)
+                self.timers["xz"].start(16)
                 self.playing_state["xz"] = True
                 self.xz_play_button.setIcon(self.create_pause_icon())
 
@@ -328,7 +406,7 @@ class ImageViewer(QWidget):
         elif view == "yz":
             self.playing_state["yz"] = not self.playing_state["yz"]
             if self.playing_state["yz"]:
-                self.timers["yz"].start(2)
+                self.timers["yz"].start(16)
                 self.playing_state["yz"] = True
                 self.yz_play_button.setIcon(self.create_pause_icon())
 
@@ -337,11 +415,51 @@ class ImageViewer(QWidget):
                 self.playing_state["yz"] = False
                 self.yz_play_button.setIcon(self.create_play_icon())
 
-    def load_image(self, image_array):
+        self.update_interaction()
+
+    def set_slider_dragging(self, dragging):
+        self._slider_dragging = dragging
+        self.update_interaction()
+
+    def update_interaction(self):
+        """
+        Switch to the low-resolution path while interacting and back to full resolution afterwards.
+        """
+        interacting = self._slider_dragging or any(self.playing_state.values())
+        if interacting != self._interacting:
+            self._interacting = interacting
+            if not interacting:
+                self.update_all_images()
+
+    def load_image(self, image_array, bounds):
         """
         Load the image array and initialize sliders.
         """
         self.image_array = image_array
+        # Normalization window shared by every slice of the volume
+        self.vol_min, self.vol_max = bounds
+        self.inv_range = 255.0 / (self.vol_max - self.vol_min) if self.vol_max != self.vol_min else 0.0
+        # Quantize the whole volume to display range once
+        depth, rows, cols = image_array.shape
+        self.vol_u8 = np.empty(image_array.shape, dtype=np.uint8)
+        quantize_u8(image_array, self.vol_u8, self.vol_min, self.inv_range)
+        # Axis-major copies so every view reads its slice from contiguous memory
+        self.vol_xy = self.vol_u8
+        self.vol_xz = np.ascontiguousarray(self.vol_u8.transpose(1, 0, 2))
+        self.vol_yz = np.ascontiguousarray(self.vol_u8.transpose(2, 0, 1))
+        # Half-resolution pyramid level shown while scrolling or playing
+        self.vol_lo_xy = np.ascontiguousarray(self.vol_u8[::2, ::2, ::2])
+        self.vol_lo_xz = np.ascontiguousarray(self.vol_lo_xy.transpose(1, 0, 2))
+        self.vol_lo_yz = np.ascontiguousarray(self.vol_lo_xy.transpose(2, 0, 1))
+        # Persistent display buffers, one per plane, reused by every redraw
+        self._u8 = {
+            "xy": np.empty((rows, cols), dtype=np.uint8),
+            "xz": np.empty((depth, cols), dtype=np.uint8),
+            "zy": np.empty((depth, rows), dtype=np.uint8),
+        }
+        self._u8_lo = {plane: np.empty(self.get_volume(plane, low_res=True).shape[1:], dtype=np.uint8)
+                       for plane in ("xy", "xz", "zy")}
+        self._base_key.clear()
         max_axial = self.image_array.shape[0] - 1
         max_sagittal = self.image_array.shape[1] - 1
         max_coronal = self.image_array.shape[2] - 1
@@ -371,63 +489,84 @@ class ImageViewer(QWidget):
 
     def update_xy_image(self, slice_idx):
         if self.image_array is not None:
-            slice_image = self.image_array[slice_idx, :, :]
-            # Apply 180-degree rotation (flipping vertically and horizontally)
-            slice_image = np.flipud(np.fliplr(slice_image))
             # Display the adjusted image
-            self.display_image(slice_image, self.xy_label, plane='xy', zoom_factor=self.zoom_level_xy)
+            self.display_image(slice_idx, self.xy_view, plane='xy', zoom_factor=self.zoom_level_xy)
 
     def update_xz_image(self, slice_idx):
         if self.image_array is not None:
-            slice_image = self.image_array[:, slice_idx, :]
-
-            # Apply 180-degree rotation (flipping vertically and horizontally)
-            slice_image = np.flipud(np.fliplr(slice_image))
-
             # Display the adjusted image
-            self.display_image(slice_image, self.xz_label, plane='xz', zoom_factor=self.zoom_level_xz)
+            self.display_image(slice_idx, self.xz_view, plane='xz', zoom_factor=self.zoom_level_xz)
 
     def update_zy_image(self, slice_idx):
         if self.image_array is not None:
-            slice_image = self.image_array[:, :, slice_idx]
-            # Apply 180-degree rotation (flipping vertically and horizontally)
-            slice_image = np.flipud(np.fliplr(slice_image))
-
             # Display the adjusted image
-            self.display_image(slice_image, self.zy_label, plane='zy', zoom_factor=self.zoom_level_yz)
-
-    def display_image(self, slice_image, label, plane, zoom_factor=0.4):
-        height, width = slice_image.shape
-        min_val = np.min(slice_image)
-        max_val = np.max(slice_image)
+            self.display_image(slice_idx, self.zy_view, plane='zy', zoom_factor=self.zoom_level_yz)
 
-        # Normalize the image
-        if max_val != min_val:
-            slice_image = (slice_image - min_val) / (max_val - min_val) * 255
+    def get_volume(self, plane, low_res=False):
+        """
+        Return the axis-major quantized volume whose first axis indexes the plane's slices.
+        """
+        if low_res:
+            volumes = {'xy': self.vol_lo_xy, 'xz': self.vol_lo_xz, 'zy': self.vol_lo_yz}
         else:
-            slice_image = np.zeros_like(slice_image)
+            volumes = {'xy': self.vol_xy, 'xz': self.vol_xz, 'zy': self.vol_yz}
+        return volumes[plane]
+
+    def display_image(self, slice_idx, view_widget, plane, zoom_factor=0.4):
+        self.draw_base_pixmap(slice_idx, view_widget, plane, zoom_factor)
+        self.draw_overlay(view_widget, plane)
+
+    def draw_base_pixmap(self, slice_idx, view_widget, plane, zoom_factor):
+        """
+        Render the scaled slice pixmap of a plane into its scene, unless the shown one is still valid.
+        """
+        low_res = self._interacting
+        key = (slice_idx, zoom_factor, low_res)
+        if self._base_key.get(plane) == key:
+            return
+
+        full_height, full_width = self._u8[plane].shape
+        slice_image = self._u8_lo[plane] if low_res else self._u8[plane]
+        height, width = slice_image.shape
 
-        # Apply brightness and contrast adjustments
-        brightness = self.brightness[plane]
-        contrast = self.contrast[plane]
-        slice_image = np.clip(slice_image * contrast + brightness, 0, 255).astype(np.uint8)
-        q_image = QImage(slice_image.data, width, height, QImage.Format_Grayscale8)
+        # Rotate the slice by 180 degrees and apply brightness/contrast through the view's lookup table
+        render_plane(self.get_volume(plane, low_res), slice_idx // 2 if low_res else slice_idx,
+                     self._lut[plane], slice_image)
+        # Pass the real row stride so Qt never assumes 32-bit aligned scanlines
+        q_image = QImage(slice_image.data, width, height, slice_image.strides[0], QImage.Format_Grayscale8)
         pixmap = QPixmap.fromImage(q_image)
 
+        # Scale once for displaying in the view, to the zoomed full-resolution size
+        transform = Qt.FastTransformation if low_res else Qt.SmoothTransformation
+        target = QSize(full_width, full_height) * zoom_factor
+        self._base_pix[plane] = pixmap.scaled(target, Qt.KeepAspectRatio, transform)
+        self._base_key[plane] = key
+
+        pixmap_item = self._pix_item[plane]
+        pixmap_item.setPixmap(self._base_pix[plane])
+        pixmap_item.scene().setSceneRect(QRectF(self._base_pix[plane].rect()))
+        view_widget.centerOn(pixmap_item)
+
+    def draw_overlay(self, view_widget, plane):
+        """
+        Move the crosshair items of a plane over its slice; the slice pixmap itself is not repainted.
+        """
+        pixmap = self._base_pix.get(plane)
+        if pixmap is None:
+            return
+
+        visible = False
         # Draw crosshair if the current position is set
         if self.current_crosshair is not None:
-            painter = QPainter(pixmap)
-            painter.setPen(QColor(255, 0, 0))  # Red color for crosshair
+            height, width = self._u8[plane].shape
             crosshair_x, crosshair_y = self.current_crosshair
 
-            # Scale the pixmap to match the label size
-            scaled_pixmap = pixmap.scaled(label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            scaled_width = scaled_pixmap.width()
-            scaled_height = scaled_pixmap.height()
+            # Size of the image when fitted to the view
+            scaled_width, scaled_height = self.fitted_size(width, height, view_widget.size())
 
-            # Calculate offset for centered image in label
-            offset_x = (label.width() - scaled_width) // 2
-            offset_y = (label.height() - scaled_height) // 2
+            # Calculate offset for centered image in view
+            offset_x = (view_widget.width() - scaled_width) // 2
+            offset_y = (view_widget.height() - scaled_height) // 2
 
             # Map cursor crosshair coordinates to scaled image dimensions
             scale_x = width / scaled_width if scaled_width != 0 else 1
@@ -438,56 +577,69 @@ class ImageViewer(QWidget):
             crosshair_y = int((crosshair_y - offset_y) * scale_y)
 
             # Ensure crosshair is drawn within bounds
-            if 0 <= crosshair_x < pixmap.width() and 0 <= crosshair_y < pixmap.height():
-                # Draw crosshair lines
-                painter.drawLine(crosshair_x, 0, crosshair_x, pixmap.height())  # Vertical line
-                painter.drawLine(0, crosshair_y, pixmap.width(), crosshair_y)  # Horizontal line
-
-                # Draw small circle at the crosshair position
-                painter.setPen(QColor(0, 255, 0))  # Green color for
-                painter.drawEllipse(crosshair_x - 5, crosshair_y - 5, 10, 10)  # Small circle displaying on crosshair
-                # painter.setBrush(QColor(0, 255, 0))  # Set brush color for filling dots
+            if 0 <= crosshair_x < width and 0 <= crosshair_y < height:
+                # Move the crosshair into the coordinates of the zoomed pixmap
+                crosshair_x = crosshair_x * pixmap.width() // width
+                crosshair_y = crosshair_y * pixmap.height() // height
 
-        # Scale the pixmap again for displaying in the label
-        scaled_pixmap = pixmap.scaled(pixmap.size() * zoom_factor, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                vertical_line, horizontal_line, circle = self._crosshair_items[plane]
+                vertical_line.setLine(crosshair_x, 0, crosshair_x, pixmap.height())
+                horizontal_line.setLine(0, crosshair_y, pixmap.width(), crosshair_y)
+                circle.setRect(crosshair_x - 5, crosshair_y - 5, 10, 10)
+                visible = True
 
-        # Set the scaled pixmap in the label
-        label.setPixmap(scaled_pixmap)
+        for item in self._crosshair_items[plane]:
+            item.setVisible(visible)
 
-        return pixmap
-
-    def update_crosshair(self):
+    def refresh_overlay_only(self):
         """
-        Update crosshair positions across all views.
+        Repaint the crosshair on every view without re-rendering the slices.
         """
-        if self.current_crosshair is None:
-            return
+        self.draw_overlay(self.xy_view, 'xy')
+        self.draw_overlay(self.xz_view, 'xz')
+        self.draw_overlay(self.zy_view, 'zy')
 
-        self.update_all_images()
+    def fitted_size(self, width, height, target):
+        """
+        Return the size of a width x height image scaled into target with Qt.KeepAspectRatio.
+        """
+        if width == 0 or height == 0:
+            return 0, 0
+        fitted_width = target.height() * width // height
+        if fitted_width <= target.width():
+            return fitted_width, target.height()
+        return target.width(), target.width() * height // width
+
+    def schedule_redraw(self):
+        """
+        Request a crosshair repaint of all views, merged with any repaint already pending.
+        """
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
 
     def mouse_move_event_xy(self, event):
         """
         Handle mouse move in XY view.
         """
-        if self.xy_label.rect().contains(event.pos()):
+        if self.xy_view.rect().contains(event.pos()):
             self.current_crosshair = (event.pos().x(), event.pos().y())
-            self.update_all_images()
+            self.schedule_redraw()
 
     def mouse_move_event_xz(self, event):
         """
         Handle mouse move in XZ view.
         """
-        if self.xz_label.rect().contains(event.pos()):
+        if self.xz_view.rect().contains(event.pos()):
             self.current_crosshair = (event.pos().x(), event.pos().y())
-            self.update_all_images()
+            self.schedule_redraw()
 
     def mouse_move_event_zy(self, event):
         """
         Handle mouse move in ZY view.
         """
-        if self.zy_label.rect().contains(event.pos()):
+        if self.zy_view.rect().contains(event.pos()):
             self.current_crosshair = (event.pos().x(), event.pos().y())
-            self.update_all_images()
+            self.schedule_redraw()
 
     def mouse_press_event_xy(self, event):
         """
@@ -496,21 +648,19 @@ class ImageViewer(QWidget):
         max_coronal = self.image_array.shape[2] - 1
         max_sagittal = self.image_array.shape[1] - 1
 
-        if self.xy_label.rect().contains(event.pos()) and self.image_array is not None:
+        if self.xy_view.rect().contains(event.pos()) and self.image_array is not None:
             # Get the size of the pixmap to determine scaling
-            current_pixmap = self.xy_label.pixmap()
+            current_pixmap = self._base_pix.get('xy')
             if current_pixmap is None:
                 return  # Exit if there's no pixmap available
 
-            scaled_pixmap = current_pixmap.scaled(self.xy_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
-            # Get the size of the scaled pixmap
-            scaled_width = scaled_pixmap.width()
-            scaled_height = scaled_pixmap.height()
+            # Get the size of the pixmap fitted to the view
+            scaled_width, scaled_height = self.fitted_size(current_pixmap.width(), current_pixmap.height(),
+                                                           self.xy_view.size())
 
             # Calculate offset for centering the image
-            offset_x = (self.xy_label.width() - scaled_width) // 2
-            offset_y = (self.xy_label.height() - scaled_height) // 2
+            offset_x = (self.xy_view.width() - scaled_width) // 2
+            offset_y = (self.xy_view.height() - scaled_height) // 2
 
             # Get mouse coordinates
             x = event.pos().x() - offset_x
@@ -537,21 +687,19 @@ class ImageViewer(QWidget):
         max_axial = self.image_array.shape[0] - 1
         max_sagittal = self.image_array.shape[1] - 1
 
-        if self.zy_label.rect().contains(event.pos()) and self.image_array is not None:
+        if self.zy_view.rect().contains(event.pos()) and self.image_array is not None:
             # Get the size of the pixmap to determine scaling
-            current_pixmap = self.zy_label.pixmap()
+            current_pixmap = self._base_pix.get('zy')
             if current_pixmap is None:
                 return  # Exit if there's no pixmap available
 
-            scaled_pixmap = current_pixmap.scaled(self.zy_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
-            # Get the size of the scaled pixmap
-            scaled_width = scaled_pixmap.width()
-            scaled_height = scaled_pixmap.height()
+            # Get the size of the pixmap fitted to the view
+            scaled_width, scaled_height = self.fitted_size(current_pixmap.width(), current_pixmap.height(),
+                                                           self.zy_view.size())
 
             # Calculate offset for centering the image
-            offset_x = (self.zy_label.width() - scaled_width) // 2
-            offset_y = (self.zy_label.height() - scaled_height) // 2
+            offset_x = (self.zy_view.width() - scaled_width) // 2
+            offset_y = (self.zy_view.height() - scaled_height) // 2
 
             # Get mouse coordinates
             x = event.pos().x() - offset_x
@@ -582,21 +730,19 @@ class ImageViewer(QWidget):
         max_axial = self.image_array.shape[0] - 1
         max_coronal = self.image_array.shape[2] - 1
 
-        if self.xz_label.rect().contains(event.pos()) and self.image_array is not None:
+        if self.xz_view.rect().contains(event.pos()) and self.image_array is not None:
             # Get the size of the pixmap to determine scaling
-            current_pixmap = self.xz_label.pixmap()
+            current_pixmap = self._base_pix.get('xz')
             if current_pixmap is None:
                 return  # Exit if there's no pixmap available
 
-            scaled_pixmap = current_pixmap.scaled(self.xz_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
-            # Get the size of the scaled pixmap
-            scaled_width = scaled_pixmap.width()
-            scaled_height = scaled_pixmap.height()
+            # Get the size of the pixmap fitted to the view
+            scaled_width, scaled_height = self.fitted_size(current_pixmap.width(), current_pixmap.height(),
+                                                           self.xz_view.size())
 
             # Calculate offset for centering the image
-            offset_x = (self.xz_label.width() - scaled_width) // 2
-            offset_y = (self.xz_label.height() - scaled_height) // 2
+            offset_x = (self.xz_view.width() - scaled_width) // 2
+            offset_y = (self.xz_view.height() - scaled_height) // 2
 
             # Get mouse coordinates
             x = event.pos().x() - offset_x
@@ -621,17 +767,50 @@ class VolumeRenderer(QWidget):
     """
     3D Volume Rendering using VTK.
     """
+    max_texture_size = 512  # Largest volume dimension uploaded to the GPU before downsampling
 
     def __init__(self, parent=None):
         super().__init__(parent)
         # Initialize renderer and related attributes before calling initUI
         self.renderer = vtk.vtkRenderer()
-        self.volume = None
-        self.volume_mapper = None
-        self.volume_property = vtk.vtkVolumeProperty()
+        self.renderer.SetBackground(0.1, 0.1, 0.1)
         self.color_transfer_function = vtk.vtkColorTransferFunction()
         self.opacity_transfer_function = vtk.vtkPiecewiseFunction()
-        self.image_importer = None
+        self._vtk_keepalive = None  # NumPy buffer shared with the image importer
+        # Two quantization buffers reused across loads, grown only when a larger volume arrives;
+        # a load always writes into the one the importer is not reading from
+        self._scratch = [None, None]
+        self._scratch_lock = threading.Lock()
+
+        # The pipeline is built once; later loads only swap the importer's buffer
+        self.image_importer = vtk.vtkImageImport()
+        self.image_importer.SetDataScalarType(vtk.VTK_UNSIGNED_CHAR)
+        self.image_importer.SetNumberOfScalarComponents(1)  # Grayscale
+
+        # Setup Volume Mapper
+        self.volume_mapper = vtk.vtkSmartVolumeMapper()
+        self.volume_mapper.SetInputConnection(self.image_importer.GetOutputPort())
+        self.volume_mapper.SetBlendModeToComposite()
+        # Coarsen sampling only while interacting; still renders use the sample distance set on load
+        self.volume_mapper.SetAutoAdjustSampleDistances(False)
+        self.volume_mapper.SetInteractiveAdjustSampleDistances(True)
+
+        # Setup Volume Property
+        self.volume_property = vtk.vtkVolumeProperty()
+        self.volume_property.SetColor(self.color_transfer_function)
+        self.volume_property.SetScalarOpacity(self.opacity_transfer_function)
+        self.volume_property.ShadeOn()
+        self.volume_property.SetInterpolationTypeToLinear()
+
+        # Setup Volume; it is added to the renderer on the first load
+        self.volume = vtk.vtkVolume()
+        self.volume.SetMapper(self.volume_mapper)
+        self.volume.SetProperty(self.volume_property)
+        # Volume preparation runs on the thread pool; only the latest load is uploaded
+        self._load_generation = 0
+        self._prepare_signals = VolumePrepareSignals(self)
+        self._prepare_signals.prepared.connect(self._on_prepared)
+        self._prepare_signals.failed.connect(self._on_prepare_failed)
         self.initUI()
 
     def initUI(self):
@@ -646,10 +825,25 @@ class VolumeRenderer(QWidget):
         # Setup interactor style (optional)
         interactor_style = vtk.vtkInteractorStyleTrackballCamera()
         self.interactor.SetInteractorStyle(interactor_style)
+        # Sample with nearest-neighbour interpolation and no shading while the camera is being dragged
+        interactor_style.AddObserver("StartInteractionEvent", self.on_start_interaction)
+        interactor_style.AddObserver("EndInteractionEvent", self.on_end_interaction)
 
         self.setLayout(layout)
 
-    def load_image(self, image_array):
+    def on_start_interaction(self, obj, event):
+        self.volume_property.SetInterpolationTypeToNearest()
+        # Shading makes the ray caster estimate a gradient at every sample
+        self.volume_property.ShadeOff()
+        self.vtk_widget.GetRenderWindow().Render()
+
+    def on_end_interaction(self, obj, event):
+        # Restore full quality for the still frame
+        self.volume_property.SetInterpolationTypeToLinear()
+        self.volume_property.ShadeOn()
+        self.vtk_widget.GetRenderWindow().Render()
+
+    def load_image(self, image_array, bounds):
         """
         Load the image array and setup VTK volume rendering.
         """
@@ -657,60 +851,82 @@ class VolumeRenderer(QWidget):
             QMessageBox.warning(self, "No Image Data", "No image data to render.")
             return
 
-        # Clear previous renderer
-        self.renderer.RemoveAllViewProps()
-
-        # Determine the data type
-        if image_array.dtype == np.uint8:
-            vtk_data_type = vtk.VTK_UNSIGNED_CHAR
-        elif image_array.dtype == np.uint16:
-            vtk_data_type = vtk.VTK_UNSIGNED_SHORT
-        elif image_array.dtype == np.float32:
-            vtk_data_type = vtk.VTK_FLOAT
-        elif image_array.dtype == np.float64:
-            vtk_data_type = vtk.VTK_DOUBLE
-        else:
-            QMessageBox.critical(self, "Unsupported Data Type",
-                                 f"Data type {image_array.dtype} is not supported.")
-            return
+        # Prepare the volume off the GUI thread; _upload runs once it is ready
+        self._load_generation += 1
+        task = VolumePrepareTask(self._prepare, self._prepare_signals, self._load_generation, image_array, bounds)
+        QThreadPool.globalInstance().start(task)
 
-        # Convert NumPy array to VTK image data using vtkImageImport
-        self.image_importer = vtk.vtkImageImport()
-        data_string = image_array.tobytes()
-        self.image_importer.CopyImportVoidPointer(data_string, len(data_string))
-        self.image_importer.SetDataScalarType(vtk_data_type)
-        self.image_importer.SetNumberOfScalarComponents(1)  # Grayscale
+    def _prepare(self, generation, image_array, bounds):
+        """
+        Downsample and quantize the volume to a contiguous uint8 buffer, returning it with its voxel spacing.
+        Runs on a worker thread without touching VTK; returns None if the load has been superseded.
+        """
+        # Decimate volumes larger than the 3D texture limit, so VTK never has to resample them
+        stride = int(np.ceil(max(image_array.shape) / self.max_texture_size))
+        if stride > 1:
+            image_array = image_array[::stride, ::stride, ::stride]
+        spacing = (stride, stride, stride)  # Keeps the physical size of the volume
+
+        # Normalize the layout once to C order, matching the (x, y, z) extents given to the importer
+        image_array = np.ascontiguousarray(image_array)
+
+        # Quantize to 8 bits so the ray caster samples a smaller 3D texture
+        min_val, max_val = bounds
+        inv_range = 255.0 / (max_val - min_val) if max_val != min_val else 0.0
+        with self._scratch_lock:
+            # A newer load owns the scratch buffer now; do not overwrite its data
+            if generation != self._load_generation:
+                return None
+            # Only the latest generation can be uploaded, so the buffer in use cannot change while this runs
+            in_use = self._vtk_keepalive
+            slot = 1 if in_use is not None and np.may_share_memory(self._scratch[0], in_use) else 0
+            n = image_array.size
+            if self._scratch[slot] is None or self._scratch[slot].size < n:
+                self._scratch[slot] = np.empty(n, dtype=np.uint8)
+            quantized = self._scratch[slot][:n].reshape(image_array.shape)
+            quantize_u8(image_array, quantized, min_val, inv_range)
+        return quantized, spacing
+
+    def _on_prepared(self, generation, image_array, spacing, bounds):
+        # Drop results of loads that were superseded while being prepared
+        if generation == self._load_generation:
+            self._upload(image_array, spacing, bounds)
+
+    def _on_prepare_failed(self, generation, error_message):
+        # Errors from superseded loads are not shown
+        if generation == self._load_generation:
+            QMessageBox.critical(self, "Render Error",
+                                 f"An error occurred while preparing the 3D volume:\n{error_message}")
+
+    def _upload(self, image_array, spacing, bounds):
+        """
+        Feed a prepared uint8 volume into the VTK pipeline and render it; runs on the GUI thread.
+        """
+        # Point the importer at the new NumPy buffer; keep a reference so it outlives the importer
+        assert image_array.flags['C_CONTIGUOUS'], "vtkImageImport needs a C-contiguous buffer"
+        self._vtk_keepalive = image_array
+        self.image_importer.SetImportVoidPointer(image_array, 1)
         self.image_importer.SetDataExtent(0, image_array.shape[2] - 1,
                                           0, image_array.shape[1] - 1,
                                           0, image_array.shape[0] - 1)
         self.image_importer.SetWholeExtent(0, image_array.shape[2] - 1,
                                            0, image_array.shape[1] - 1,
                                            0, image_array.shape[0] - 1)
-        self.image_importer.SetDataSpacing(1, 1, 1)  # Adjust if spacing is known
-        self.image_importer.Update()
+        self.image_importer.SetDataSpacing(*spacing)
+        self.image_importer.Modified()
+        # No explicit Update(): the mapper pulls the imported data when the volume is rendered
 
-        # Setup Volume Mapper
-        self.volume_mapper = vtk.vtkSmartVolumeMapper()
-        self.volume_mapper.SetInputConnection(self.image_importer.GetOutputPort())
+        # Sample at voxel spacing
+        self.volume_mapper.SetSampleDistance(min(spacing))
+        self.volume_mapper.Modified()
 
         # Setup Transfer Functions
-        self.initialize_transfer_functions(image_array)
+        self.initialize_transfer_functions(*bounds)
 
-        # Setup Volume Property
-        self.volume_property = vtk.vtkVolumeProperty()
-        self.volume_property.SetColor(self.color_transfer_function)
-        self.volume_property.SetScalarOpacity(self.opacity_transfer_function)
-        self.volume_property.ShadeOn()
-        self.volume_property.SetInterpolationTypeToLinear()
-
-        # Setup Volume
-        self.volume = vtk.vtkVolume()
-        self.volume.SetMapper(self.volume_mapper)
-        self.volume.SetProperty(self.volume_property)
-        self.renderer.AddVolume(self.volume)
+        if not self.renderer.HasViewProp(self.volume):
+            self.renderer.AddVolume(self.volume)
 
         # Setup Renderer
-        self.renderer.SetBackground(0.1, 0.1, 0.1)
         self.renderer.ResetCamera()
         self.renderer.GetActiveCamera().Azimuth(30)
         self.renderer.GetActiveCamera().Elevation(30)
@@ -719,27 +935,24 @@ class VolumeRenderer(QWidget):
         # Render
         self.vtk_widget.GetRenderWindow().Render()
 
-    def initialize_transfer_functions(self, image_array):
+    def initialize_transfer_functions(self, min_val, max_val):
         """
-        Initialize default color and opacity transfer functions.
+        Initialize default color and opacity transfer functions on the quantized 0-255 scalar range.
         """
-        self.color_transfer_function.RemoveAllPoints()
-        self.opacity_transfer_function.RemoveAllPoints()
+        # Control points are chosen in intensity units, then mapped to the quantized scalars
+        inv_range = 255.0 / (max_val - min_val) if max_val != min_val else 0.0
+        points = (np.array([min_val, max_val * 0.25, max_val * 0.5, max_val]) - min_val) * inv_range
 
-        data_range = image_array.min(), image_array.max()
-        min_val, max_val = data_range
+        # Color Transfer Function: (x, r, g, b) rows, replacing all existing points in one call
+        color_points = np.column_stack((points, [[0.0, 0.0, 0.0],
+                                                 [0.85, 0.55, 0.3],
+                                                 [0.95, 0.85, 0.7],
+                                                 [1.0, 1.0, 1.0]]))
+        self.color_transfer_function.FillFromDataPointer(len(points), color_points.ravel())
 
-        # Color Transfer Function
-        self.color_transfer_function.AddRGBPoint(min_val, 0.0, 0.0, 0.0)
-        self.color_transfer_function.AddRGBPoint(max_val * 0.25, 0.85, 0.55, 0.3)
-        self.color_transfer_function.AddRGBPoint(max_val * 0.5, 0.95, 0.85, 0.7)
-        self.color_transfer_function.AddRGBPoint(max_val, 1.0, 1.0, 1.0)
-
-        # Opacity Transfer Function
-        self.opacity_transfer_function.AddPoint(min_val, 0.0)
-        self.opacity_transfer_function.AddPoint(max_val * 0.25, 0.1)
-        self.opacity_transfer_function.AddPoint(max_val * 0.5, 0.4)
-        self.opacity_transfer_function.AddPoint(max_val, 1.0)
+        # Opacity Transfer Function: (x, opacity) rows
+        opacity_points = np.column_stack((points, [0.0, 0.1, 0.4, 1.0]))
+        self.opacity_transfer_function.FillFromDataPointer(len(points), opacity_points.ravel())
 
 
 class MainWindow(QMainWindow):
@@ -749,6 +962,8 @@ class MainWindow(QMainWindow):
 
     def __init__(self):
         super().__init__()
+        self.volume_renderer = None  # Created the first time the 3D tab is shown
+        self._pending_volume = None  # (image_array, bounds) waiting for the 3D renderer
         self.initUI()
         self.image_loader_thread = None
 
@@ -780,12 +995,30 @@ class MainWindow(QMainWindow):
         # Initialize Tabs
         self.tabs = QTabWidget()
         self.image_viewer = ImageViewer()
-        self.volume_renderer = VolumeRenderer()
+        # Placeholder for the 3D renderer, so VTK and OpenGL are only initialized when needed
+        self.volume_tab = QWidget()
+        volume_layout = QVBoxLayout()
+        volume_layout.setContentsMargins(0, 0, 0, 0)
+        self.volume_tab.setLayout(volume_layout)
         self.tabs.addTab(self.image_viewer, "2D Viewer")
         self.tabs.currentChanged.connect(self.change_tab_color)
-        self.tabs.addTab(self.volume_renderer, "3D Renderer")
+        self.tabs.currentChanged.connect(self.create_volume_renderer)
+        self.tabs.addTab(self.volume_tab, "3D Renderer")
         self.setCentralWidget(self.tabs)
 
+    def create_volume_renderer(self, index):
+        """
+        Create the 3D renderer the first time its tab is selected and load any pending volume.
+        """
+        if self.volume_renderer is not None or self.tabs.widget(index) is not self.volume_tab:
+            return
+
+        self.volume_renderer = VolumeRenderer()
+        self.volume_tab.layout().addWidget(self.volume_renderer)
+        if self._pending_volume is not None:
+            self.volume_renderer.load_image(*self._pending_volume)
+            self._pending_volume = None
+
     def load_image(self):
         """
         Open file dialog to select and load NIfTI image.
@@ -804,7 +1037,7 @@ class MainWindow(QMainWindow):
             self.image_loader_thread.error_occurred.connect(self.on_load_error)
             self.image_loader_thread.start()
 
-    def on_image_loaded(self, image_array, itk_image):
+    def on_image_loaded(self, image_array, nifti_image, bounds):
         """
         Handle the loaded image data.
         """
@@ -812,10 +1045,13 @@ class MainWindow(QMainWindow):
         self.load_button.setEnabled(True)
 
         # Load image into 2D Viewer
-        self.image_viewer.load_image(image_array)
+        self.image_viewer.load_image(image_array, bounds)
 
-        # Load image into 3D Renderer
-        self.volume_renderer.load_image(image_array)
+        # Load image into 3D Renderer, or keep it until the renderer is created
+        if self.volume_renderer is not None:
+            self.volume_renderer.load_image(image_array, bounds)
+        else:
+            self._pending_volume = (image_array, bounds)
 
     def on_load_error(self, error_message):
         """
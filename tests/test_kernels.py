@@ -0,0 +1,116 @@
+import importlib
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import kernels
+
+
+def load_fallback_kernels():
+    """
+    Import a copy of kernels with numba hidden so the NumPy branch is used.
+    """
+    with mock.patch.dict(sys.modules, {'numba': None}):
+        sys.modules.pop('kernels', None)
+        try:
+            return importlib.import_module('kernels')
+        finally:
+            sys.modules['kernels'] = kernels
+
+
+class MinMaxTests:
+    module = None
+
+    def minmax(self, arr):
+        return self.module.minmax(arr)
+
+    def test_integer_volume(self):
+        arr = np.array([[3, -7], [12, 0]], dtype=np.int16)
+        self.assertEqual(self.minmax(arr), (-7.0, 12.0))
+
+    def test_empty_array(self):
+        self.assertEqual(self.minmax(np.empty((0, 4, 4), dtype=np.float32)), (0.0, 0.0))
+
+    def test_leading_nan_is_ignored(self):
+        arr = np.array([np.nan, 2.0, -1.0, 5.0], dtype=np.float32)
+        self.assertEqual(self.minmax(arr), (-1.0, 5.0))
+
+    def test_inner_nan_is_ignored(self):
+        arr = np.array([2.0, np.nan, -1.0, 5.0], dtype=np.float64)
+        self.assertEqual(self.minmax(arr), (-1.0, 5.0))
+
+    def test_all_nan(self):
+        self.assertEqual(self.minmax(np.full(8, np.nan, dtype=np.float32)), (0.0, 0.0))
+
+
+@unittest.skipIf(kernels.njit is None, "numba is not installed")
+class NumbaMinMaxTests(MinMaxTests, unittest.TestCase):
+    module = kernels
+
+
+class FallbackMinMaxTests(MinMaxTests, unittest.TestCase):
+    module = load_fallback_kernels()
+
+
+class QuantizeTests:
+    module = None
+
+    def quantize(self, src, mn, inv):
+        dst = np.empty(src.shape, dtype=np.uint8)
+        self.module.quantize_u8(src, dst, mn, inv)
+        return dst
+
+    def test_clipping(self):
+        src = np.array([[[-50.0, 10.0, 20.0, 1000.0]]], dtype=np.float32)
+        np.testing.assert_array_equal(self.quantize(src, 10.0, 2.0), [[[0, 0, 20, 255]]])
+
+    def test_integer_input(self):
+        src = np.arange(-4, 140, dtype=np.int16).reshape(2, 8, 9)
+        expected = np.clip((src.astype(np.float64) + 4) * 2, 0, 255).astype(np.uint8)
+        np.testing.assert_array_equal(self.quantize(src, -4.0, 2.0), expected)
+
+    def test_strided_input(self):
+        base = np.arange(6 * 7 * 8, dtype=np.uint16).reshape(6, 7, 8)
+        src = base[::2, ::-1, 1::3]
+        expected = np.clip(src.astype(np.float64) * 0.5, 0, 255).astype(np.uint8)
+        np.testing.assert_array_equal(self.quantize(src, 0.0, 0.5), expected)
+
+    def test_nan_maps_to_zero(self):
+        src = np.array([[[np.nan, 3.0], [5.0, np.nan]]], dtype=np.float32)
+        np.testing.assert_array_equal(self.quantize(src, 1.0, 10.0), [[[0, 20], [40, 0]]])
+
+
+@unittest.skipIf(kernels.njit is None, "numba is not installed")
+class NumbaQuantizeTests(QuantizeTests, unittest.TestCase):
+    module = kernels
+
+
+class FallbackQuantizeTests(QuantizeTests, unittest.TestCase):
+    module = load_fallback_kernels()
+
+
+class RenderPlaneTests:
+    module = None
+
+    def test_rotates_and_maps_through_lut(self):
+        vol = np.random.default_rng(0).integers(0, 256, size=(3, 5, 7), dtype=np.uint8)
+        lut = (255 - np.arange(256) // 2).astype(np.uint8)
+        for idx in range(vol.shape[0]):
+            out = np.empty((5, 7), dtype=np.uint8)
+            self.module.render_plane(vol, idx, lut, out)
+            np.testing.assert_array_equal(out, lut[vol[idx][::-1, ::-1]])
+
+
+@unittest.skipIf(kernels.njit is None, "numba is not installed")
+class NumbaRenderPlaneTests(RenderPlaneTests, unittest.TestCase):
+    module = kernels
+
+
+class FallbackRenderPlaneTests(RenderPlaneTests, unittest.TestCase):
+    module = load_fallback_kernels()
+
+
+if __name__ == '__main__':
+    unittest.main()